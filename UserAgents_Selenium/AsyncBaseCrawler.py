@@ -0,0 +1,127 @@
+"""
+AsyncBaseCrawler - Abstract base class for crawling static pages with asyncio and aiohttp.
+
+This module provides a lightweight alternative to BaseCrawler for pages that do not
+need JavaScript: pages are fetched over HTTP with connection reuse and parsed with lxml,
+without starting a browser.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+import asyncio
+import logging
+import aiohttp
+import lxml.html
+from CrawlerLogging import get_logger
+
+
+class AsyncBaseCrawler(ABC):
+    """
+    Abstract base class for crawling static web pages with asyncio.
+
+    The crawler owns an aiohttp.ClientSession, opened and closed by the async
+    context manager protocol, so every request shares the same connection pool
+    and DNS cache. Derived classes must implement the `manage()` coroutine to
+    define how to process the parsed page. Use BaseCrawler for JavaScript-heavy sites.
+
+    Attributes:
+        session (aiohttp.ClientSession): The HTTP session, available inside `async with`
+        logger (logging.Logger): Logger instance for the crawler
+    """
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        user_agent: Optional[str] = None,
+        max_connections: int = 100,
+        log_level: int = logging.INFO
+    ):
+        """
+        Initialize the AsyncBaseCrawler.
+
+        Args:
+            timeout (int): Total timeout for each request in seconds. Default is 10.
+            user_agent (str, optional): Custom user agent string. Default is None.
+            max_connections (int): Maximum number of simultaneous connections. Default is 100.
+            log_level (int): Logging level. Default is logging.INFO.
+        """
+        self.logger = get_logger(self.__class__.__name__, log_level)
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        """
+        Async context manager entry - opens the HTTP session.
+
+        Returns:
+            AsyncBaseCrawler: Self instance
+        """
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"User-Agent": self.user_agent} if self.user_agent else None
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Async context manager exit - closes the HTTP session.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+        """
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def crawl(self, url: str) -> None:
+        """
+        Fetch and parse the specified URL, then call the manage coroutine.
+
+        Args:
+            url (str): The URL to crawl
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+            asyncio.TimeoutError: If the request times out
+        """
+        try:
+            self.logger.info(f"Fetching URL: {url}")
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                html = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"HTTP error while fetching {url}: {e}")
+            raise
+
+        await self.manage(url, lxml.html.fromstring(html))
+
+    async def crawl_many(self, urls: Iterable[str]) -> None:
+        """
+        Crawl several URLs concurrently over the shared session.
+
+        The pages finish in any order, so manage() should add to the instance
+        state rather than overwrite it.
+
+        Args:
+            urls (Iterable[str]): The URLs to crawl
+        """
+        await asyncio.gather(*(self.crawl(url) for url in urls))
+
+    @abstractmethod
+    async def manage(self, url: str, document: lxml.html.HtmlElement) -> None:
+        """
+        Abstract coroutine to manage/process the parsed page.
+
+        The document is passed in rather than stored on the instance, since
+        several pages may be processed concurrently.
+
+        Args:
+            url (str): The URL the document was fetched from
+            document (lxml.html.HtmlElement): The parsed page
+        """
+        pass
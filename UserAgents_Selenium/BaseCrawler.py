@@ -6,8 +6,19 @@ to interact with web pages in a headless Chrome browser.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Type
+import atexit
+import importlib.util
 import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import httpx
+import lxml.html
+from CrawlerLogging import get_logger
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -15,6 +26,32 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException, TimeoutException
 
+# Number of idle, pre-warmed drivers kept ready for each set of browser options
+POOL_SIZE = int(os.environ.get("CRAWLER_POOL_SIZE", "1"))
+
+# Requests that are pure overhead when only the page text is needed
+BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.gif', '*.woff*', '*.css', '*.mp4',
+    '*google-analytics*', '*doubleclick*',
+)
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]"); without it use HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Startup flags that trim Chrome's memory footprint and initialization work
+CHROME_LEAN_ARGUMENTS = (
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-default-apps',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--mute-audio',
+    '--no-first-run',
+    '--no-zygote',
+    '--disk-cache-size=0',
+)
+
 
 class BaseCrawler(ABC):
     """
@@ -24,12 +61,31 @@ class BaseCrawler(ABC):
     Selenium WebDriver with a headless Chrome browser. Derived classes must
     implement the `manage()` method to define how to process the crawled content.
 
+    Chrome takes seconds to start, so drivers are not quit when a crawler is
+    closed: they are reset and handed back to a class-level pool, from which
+    the next crawler with the same browser options picks a ready driver.
+    The pool size is read from the CRAWLER_POOL_SIZE environment variable;
+    0 disables pooling and every driver is quit on close.
+
+    The driver is only acquired the first time `driver` is used, so pages that
+    need no JavaScript can be fetched with `crawl_static()` without ever
+    starting the browser.
+
     Attributes:
         driver (webdriver.Chrome): The Selenium WebDriver instance
         wait (WebDriverWait): WebDriverWait instance for explicit waits
         logger (logging.Logger): Logger instance for the crawler
     """
 
+    # Idle drivers, one queue per combination of browser options
+    _pool: Dict[Tuple, "queue.Queue[webdriver.Chrome]"] = {}
+    _pool_lock = threading.Lock()
+    # Background refill threads, one per set of options, and the flag that stops them at exit
+    _filling: Dict[Tuple, threading.Thread] = {}
+    _closing = threading.Event()
+    # Chrome's own navigator.userAgent without "Headless", read once per process
+    _default_user_agent: Optional[str] = None
+
     def __init__(
         self,
         headless: bool = True,
@@ -37,6 +93,7 @@ class BaseCrawler(ABC):
         window_size: str = "1920,1080",
         user_agent: Optional[str] = None,
         disable_images: bool = False,
+        block_resources: bool = False,
         log_level: int = logging.INFO
     ):
         """
@@ -48,19 +105,68 @@ class BaseCrawler(ABC):
             window_size (str): Browser window size as "width,height". Default is "1920,1080".
             user_agent (str, optional): Custom user agent string. Default is None.
             disable_images (bool): Disable image loading for faster crawling. Default is False.
+            block_resources (bool): Block images, fonts, CSS, media and trackers. Default is False.
             log_level (int): Logging level. Default is logging.INFO.
         """
         self.logger = self._setup_logger(log_level)
         self.timeout = timeout
-        self.driver = self._initialize_driver(
+        self.user_agent = user_agent
+        self._driver_options = dict(
             headless=headless,
             window_size=window_size,
             user_agent=user_agent,
-            disable_images=disable_images
+            disable_images=disable_images,
+            block_resources=block_resources
         )
-        self.wait = WebDriverWait(self.driver, timeout)
+        self._driver = None
+        self._wait = None
+        self._http = None
+        # Values read from the current page, dropped at every navigation
+        self._page_cache: dict = {}
         self.logger.info("BaseCrawler initialized successfully")
 
+    @classmethod
+    def from_driver(cls, driver: webdriver.Chrome, **kwargs) -> "BaseCrawler":
+        """
+        Create a crawler bound to an already running driver.
+
+        Args:
+            driver (webdriver.Chrome): The driver the crawler will use
+            **kwargs: Arguments to pass to the crawler constructor
+
+        Returns:
+            BaseCrawler: The crawler instance
+        """
+        crawler = cls(**kwargs)
+        crawler._driver = driver
+        crawler._wait = WebDriverWait(driver, crawler.timeout)
+        return crawler
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """
+        The Selenium WebDriver instance, acquired from the pool on first use.
+
+        Returns:
+            webdriver.Chrome: The Chrome WebDriver instance
+        """
+        if self._driver is None:
+            self._driver = self.acquire(**self._driver_options)
+            self._wait = WebDriverWait(self._driver, self.timeout)
+        return self._driver
+
+    @property
+    def wait(self) -> WebDriverWait:
+        """
+        WebDriverWait instance bound to the current driver.
+
+        Returns:
+            WebDriverWait: WebDriverWait instance for explicit waits
+        """
+        if self._wait is None:
+            self.driver  # acquiring the driver also creates the wait
+        return self._wait
+
     def _setup_logger(self, log_level: int) -> logging.Logger:
         """
         Set up logger for the crawler.
@@ -71,25 +177,133 @@ class BaseCrawler(ABC):
         Returns:
             logging.Logger: Configured logger instance
         """
-        logger = logging.getLogger(self.__class__.__name__)
-        logger.setLevel(log_level)
+        return get_logger(self.__class__.__name__, log_level)
 
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '{ "time":"%(asctime)s", "class":"%(name)s", "level":"%(levelname)s", "message":"%(message)s" }'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+    @classmethod
+    def _pool_for(cls, key: Tuple) -> "queue.Queue[webdriver.Chrome]":
+        """
+        Get (or create) the queue of idle drivers for a set of options.
+
+        Args:
+            key (tuple): Hashable representation of the browser options
+
+        Returns:
+            queue.Queue: Queue of idle drivers for those options
+        """
+        with cls._pool_lock:
+            if key not in BaseCrawler._pool:
+                BaseCrawler._pool[key] = queue.Queue(maxsize=max(POOL_SIZE, 1))
+            return BaseCrawler._pool[key]
+
+    @classmethod
+    def _fill(cls, key: Tuple, opts: dict) -> None:
+        """
+        Keep the pool for the given options topped up to POOL_SIZE drivers.
+
+        Runs in a background thread started by acquire() and stops as soon as
+        the interpreter starts exiting.
+
+        Args:
+            key (tuple): Hashable representation of the browser options
+            opts (dict): Browser options passed to _initialize_driver
+        """
+        pool = cls._pool_for(key)
+        try:
+            while not BaseCrawler._closing.is_set() and pool.qsize() < POOL_SIZE:
+                driver = cls._initialize_driver(**opts)
+                if BaseCrawler._closing.is_set():
+                    # Started while exiting: nobody is left to use it
+                    cls._quit_driver(driver)
+                    break
+                try:
+                    pool.put_nowait(driver)
+                except queue.Full:
+                    cls._quit_driver(driver)
+                    break
+        except WebDriverException:
+            pass
+        finally:
+            with cls._pool_lock:
+                BaseCrawler._filling.pop(key, None)
+
+    @classmethod
+    def acquire(cls, **opts) -> webdriver.Chrome:
+        """
+        Get a driver for the given options, from the pool if one is ready.
+
+        When a pooled driver is taken, a background thread refills the pool so
+        the next crawler does not have to wait for Chrome to start. A cold
+        start does not trigger a refill: the driver itself goes back to the
+        pool on release, so one-shot runs only ever start one browser.
+
+        Args:
+            **opts: Browser options accepted by _initialize_driver
+
+        Returns:
+            webdriver.Chrome: A ready Chrome WebDriver instance
+        """
+        key = tuple(sorted(opts.items()))
+        try:
+            driver = cls._pool_for(key).get_nowait()
+        except queue.Empty:
+            driver = cls._initialize_driver(**opts)
+            driver.pool_key = key
+            return driver
+
+        driver.pool_key = key
+        with cls._pool_lock:
+            if key not in BaseCrawler._filling and not BaseCrawler._closing.is_set():
+                thread = threading.Thread(target=cls._fill, args=(key, opts), daemon=True)
+                BaseCrawler._filling[key] = thread
+                thread.start()
+        return driver
+
+    @classmethod
+    def release(cls, driver: webdriver.Chrome) -> None:
+        """
+        Reset a driver and give it back to the pool, or quit it if the pool is full.
 
-        return logger
+        Drivers that did not come from acquire() (e.g. passed to from_driver())
+        have no pool to go back to and are quit.
+
+        Args:
+            driver (webdriver.Chrome): The driver to release
+        """
+        key = getattr(driver, "pool_key", None)
+        if key is None or POOL_SIZE <= 0 or BaseCrawler._closing.is_set():
+            cls._quit_driver(driver)
+            return
+        pool = cls._pool_for(key)
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            pool.put_nowait(driver)
+        except (WebDriverException, queue.Full):
+            cls._quit_driver(driver)
+
+    @staticmethod
+    def _quit_driver(driver: webdriver.Chrome) -> None:
+        """
+        Quit a driver for good and remove its temporary Chrome profile.
 
+        Args:
+            driver (webdriver.Chrome): The driver to quit
+        """
+        try:
+            driver.quit()
+        finally:
+            profile_dir = getattr(driver, "profile_dir", None)
+            if profile_dir:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+
+    @classmethod
     def _initialize_driver(
-        self,
+        cls,
         headless: bool,
         window_size: str,
         user_agent: Optional[str],
-        disable_images: bool
+        disable_images: bool,
+        block_resources: bool = False
     ) -> webdriver.Chrome:
         """
         Initialize and configure the Chrome WebDriver.
@@ -99,6 +313,7 @@ class BaseCrawler(ABC):
             window_size (str): Browser window size
             user_agent (str, optional): Custom user agent string
             disable_images (bool): Disable image loading
+            block_resources (bool): Block requests matching BLOCKED_URL_PATTERNS
 
         Returns:
             webdriver.Chrome: Configured Chrome WebDriver instance
@@ -118,6 +333,12 @@ class BaseCrawler(ABC):
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument(f'--window-size={window_size}')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        for argument in CHROME_LEAN_ARGUMENTS:
+            chrome_options.add_argument(argument)
+
+        # Throwaway profile under /tmp, removed when the driver is quit
+        profile_dir = tempfile.mkdtemp(prefix="cr-")
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
 
         # Custom user agent
         if user_agent:
@@ -128,26 +349,50 @@ class BaseCrawler(ABC):
             prefs = {"profile.managed_default_content_settings.images": 2}
             chrome_options.add_experimental_option("prefs", prefs)
 
+        # Return control at DOMContentLoaded instead of waiting for every subresource
+        chrome_options.page_load_strategy = 'eager'
+
         # Additional options to avoid detection
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
+        driver = None
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": driver.execute_script("return navigator.userAgent").replace('Headless', '')
-            })
-            self.logger.info("Chrome WebDriver initialized successfully")
+            # keep_alive: one HTTP connection reused for every WebDriver command
+            service = Service()
+            driver = webdriver.Chrome(service=service, options=chrome_options, keep_alive=True)
+            driver.profile_dir = profile_dir
+            # A custom user agent is already set by --user-agent: no override round-trips needed
+            if not user_agent:
+                if BaseCrawler._default_user_agent is None:
+                    BaseCrawler._default_user_agent = driver.execute_script("return navigator.userAgent").replace('Headless', '')
+                driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+                    "userAgent": BaseCrawler._default_user_agent
+                })
+            if block_resources:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+                # Keep the cache on (in memory, see --disk-cache-size=0) for repeats across crawl_many() pages
+                driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+            logging.getLogger(cls.__name__).info("Chrome WebDriver initialized successfully")
             return driver
-        except WebDriverException as e:
-            self.logger.error(f"Failed to initialize Chrome WebDriver: {e}")
+        except Exception as e:
+            if driver is None:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            else:
+                # Chrome is already running (a CDP setup call failed): quit it, profile included
+                try:
+                    cls._quit_driver(driver)
+                except WebDriverException:
+                    pass
+            logging.getLogger(cls.__name__).error(f"Failed to initialize Chrome WebDriver: {e}")
             raise
 
     def crawl(self, url: str) -> None:
         """
         Crawl the specified URL and call the manage method.
 
-        This method navigates to the given URL, waits for the page to load,
+        This method navigates to the given URL, waits for the DOM to be ready,
         and then calls the abstract manage() method that must be implemented
         by derived classes.
 
@@ -159,15 +404,20 @@ class BaseCrawler(ABC):
             WebDriverException: If navigation fails
         """
         try:
-            self.logger.info(f"Crawling URL: {url}")
+            # Build the f-strings only when they are going to be logged
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info(f"Crawling URL: {url}")
+            self._page_cache.clear()
             self.driver.get(url)
 
-            # Wait for page to be ready
+            # Wait for the DOM to be ready: manage() only needs the DOM, not images or trackers
             self.wait.until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+                lambda driver: driver.execute_script("return document.readyState") in ("interactive", "complete")
             )
 
-            self.logger.info(f"Page loaded successfully: {url}")
+            if log_info:
+                self.logger.info(f"Page loaded successfully: {url}")
 
             # Call the abstract manage method
             self.manage()
@@ -182,6 +432,57 @@ class BaseCrawler(ABC):
             self.logger.error(f"Unexpected error while crawling {url}: {e}")
             raise
 
+    def crawl_many(self, urls: Iterable[str]) -> None:
+        """
+        Crawl several URLs in a row with the same driver and tab.
+
+        The browser session is reused between pages instead of being quit and
+        started again, so manage() should append to the instance state rather
+        than overwrite it.
+
+        Args:
+            urls (Iterable[str]): The URLs to crawl
+
+        Raises:
+            TimeoutException: If a page load times out
+            WebDriverException: If navigation fails
+        """
+        for url in urls:
+            self.crawl(url)
+            if self._driver is not None:
+                # Stop pending requests and drop the timing buffers of the previous page
+                self._driver.execute_script("window.stop(); performance.clearResourceTimings();")
+
+    def crawl_static(self, url: str) -> lxml.html.HtmlElement:
+        """
+        Fetch the specified URL over plain HTTP and parse it, without the browser.
+
+        Static pages do not need the render pipeline: a single HTTP request
+        plus lxml parsing is several times faster than a Chrome page load.
+        The HTTP client (and its connections) is reused across calls.
+
+        Args:
+            url (str): The URL to fetch
+
+        Returns:
+            lxml.html.HtmlElement: The parsed document, ready for XPath queries
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if self._http is None:
+            headers = {"User-Agent": self.user_agent} if self.user_agent else None
+            self._http = httpx.Client(http2=HTTP2_AVAILABLE, headers=headers, timeout=self.timeout,
+                                      follow_redirects=True)
+        try:
+            self.logger.info(f"Fetching URL: {url}")
+            response = self._http.get(url)
+            response.raise_for_status()
+            return lxml.html.fromstring(response.text)
+        except httpx.HTTPError as e:
+            self.logger.error(f"HTTP error while fetching {url}: {e}")
+            raise
+
     @abstractmethod
     def manage(self) -> None:
         """
@@ -208,19 +509,35 @@ class BaseCrawler(ABC):
         """
         Get the current page source HTML.
 
+        The value is read once per page: call invalidate_page_cache() after
+        interactions that change the DOM.
+
         Returns:
             str: The page source HTML
         """
-        return self.driver.page_source
+        if 'source' not in self._page_cache:
+            self._page_cache['source'] = self.driver.page_source
+        return self._page_cache['source']
 
     def get_current_url(self) -> str:
         """
         Get the current URL.
 
+        The value is read once per page: call invalidate_page_cache() after
+        interactions that navigate.
+
         Returns:
             str: The current URL
         """
-        return self.driver.current_url
+        if 'current_url' not in self._page_cache:
+            self._page_cache['current_url'] = self.driver.current_url
+        return self._page_cache['current_url']
+
+    def invalidate_page_cache(self) -> None:
+        """
+        Forget the page source and URL cached for the current page.
+        """
+        self._page_cache.clear()
 
     def take_screenshot(self, filepath: str) -> bool:
         """
@@ -242,14 +559,25 @@ class BaseCrawler(ABC):
 
     def close(self) -> None:
         """
-        Close the browser and clean up resources.
+        Release the browser back to the pool and clean up resources.
+
+        Safe to call more than once. There is no destructor doing this for you:
+        use the crawler as a context manager (`with FirefoxUserAgentsCrawler() as c:`)
+        or call close() explicitly.
         """
-        if self.driver:
+        if self._http:
+            self._http.close()
+            self._http = None
+        if self._driver:
             try:
-                self.driver.quit()
-                self.logger.info("WebDriver closed successfully")
+                self.release(self._driver)
+                self.logger.info("WebDriver released successfully")
             except Exception as e:
                 self.logger.error(f"Error closing WebDriver: {e}")
+            finally:
+                # The driver now belongs to the pool (or is gone): never release it twice
+                self._driver = None
+                self._wait = None
 
     def __enter__(self):
         """
@@ -271,8 +599,184 @@ class BaseCrawler(ABC):
         """
         self.close()
 
-    def __del__(self):
+
+class CrawlerPool:
+    """
+    Run crawlers concurrently, one pre-warmed Chrome driver per worker thread.
+
+    WebDriver commands are HTTP round-trips that release the GIL, so a thread
+    pool can drive several browsers in parallel. The drivers are started once
+    and reused for every URL until the pool is shut down.
+
+    Example:
+        with CrawlerPool(max_workers=4) as pool:
+            for crawler in pool.map(MyCrawler, urls):
+                ...
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        headless: bool = True,
+        window_size: str = "1920,1080",
+        user_agent: Optional[str] = None,
+        disable_images: bool = False,
+        block_resources: bool = False
+    ):
         """
-        Destructor - ensures driver is closed when object is garbage collected.
+        Initialize the pool and start its drivers.
+
+        Args:
+            max_workers (int): Number of worker threads and drivers. Default is 4.
+            headless (bool): Run browsers in headless mode. Default is True.
+            window_size (str): Browser window size as "width,height". Default is "1920,1080".
+            user_agent (str, optional): Custom user agent string. Default is None.
+            disable_images (bool): Disable image loading for faster crawling. Default is False.
+            block_resources (bool): Block images, fonts, CSS, media and trackers. Default is False.
         """
-        self.close()
+        opts = dict(
+            headless=headless,
+            window_size=window_size,
+            user_agent=user_agent,
+            disable_images=disable_images,
+            block_resources=block_resources
+        )
+        self._opts = opts
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # One slot per worker: a driver, or None when a dead driver could not be replaced yet
+        self.drivers: "queue.Queue[Optional[webdriver.Chrome]]" = queue.Queue()
+        # Start the browsers in parallel: each one takes seconds
+        futures = [self.executor.submit(BaseCrawler._initialize_driver, **opts) for _ in range(max_workers)]
+        error = None
+        for future in futures:
+            try:
+                self.drivers.put(future.result())
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            # Do not leave the browsers that did start running
+            self.shutdown()
+            raise error
+
+    def _run(self, crawler_factory: Type[BaseCrawler], url: str) -> BaseCrawler:
+        """
+        Crawl one URL with a driver borrowed from the pool.
+
+        Args:
+            crawler_factory (Type[BaseCrawler]): The crawler class to instantiate
+            url (str): The URL to crawl
+
+        Returns:
+            BaseCrawler: The crawler, holding whatever manage() extracted
+        """
+        driver = self.drivers.get()
+        try:
+            if driver is None:
+                driver = BaseCrawler._initialize_driver(**self._opts)
+            crawler = crawler_factory.from_driver(driver)
+            try:
+                crawler.crawl(url)
+            except TimeoutException:
+                # Slow page, the session is still fine
+                raise
+            except WebDriverException:
+                # The session may be dead: do not let it serve the next URLs,
+                # the next crawl on this slot starts a new driver
+                self._discard(driver)
+                driver = None
+                raise
+            finally:
+                # The driver goes back to this pool, not to BaseCrawler's
+                crawler._driver = None
+                crawler.close()
+            return crawler
+        finally:
+            self.drivers.put(driver)
+
+    @staticmethod
+    def _discard(driver: Optional[webdriver.Chrome]) -> None:
+        """
+        Quit a driver of the pool, ignoring errors from an already dead session.
+
+        Args:
+            driver (webdriver.Chrome, optional): The driver to quit, if any
+        """
+        if driver is None:
+            return
+        try:
+            BaseCrawler._quit_driver(driver)
+        except WebDriverException:
+            pass
+
+    def map(self, crawler_factory: Type[BaseCrawler], urls: Iterable[str]) -> Iterator[BaseCrawler]:
+        """
+        Crawl every URL with a new crawler instance, in parallel.
+
+        Args:
+            crawler_factory (Type[BaseCrawler]): The crawler class to instantiate for each URL
+            urls (Iterable[str]): The URLs to crawl
+
+        Yields:
+            BaseCrawler: The crawlers, in order of completion
+
+        Raises:
+            Exception: Whatever the failing crawl raised
+        """
+        futures = [self.executor.submit(self._run, crawler_factory, url) for url in urls]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running crawls and quit every driver.
+        """
+        self.executor.shutdown(wait=True)
+        while True:
+            try:
+                self._discard(self.drivers.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        """
+        Context manager entry.
+
+        Returns:
+            CrawlerPool: Self instance
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Context manager exit - shuts the pool down.
+
+        Args:
+            exc_type: Exception type
+            exc_val: Exception value
+            exc_tb: Exception traceback
+        """
+        self.shutdown()
+
+
+@atexit.register
+def _quit_pooled_drivers() -> None:
+    """
+    Quit every idle driver left in the pool when the interpreter exits.
+
+    The refill threads are stopped and joined first, so a driver still
+    starting in the background is quit too instead of being left running.
+    """
+    BaseCrawler._closing.set()
+    with BaseCrawler._pool_lock:
+        threads = list(BaseCrawler._filling.values())
+    for thread in threads:
+        # Enough for a Chrome start to finish; the thread quits what it started
+        thread.join(timeout=60)
+    for pool in list(BaseCrawler._pool.values()):
+        while True:
+            try:
+                BaseCrawler._quit_driver(pool.get_nowait())
+            except queue.Empty:
+                break
+            except WebDriverException:
+                pass
@@ -0,0 +1,34 @@
+"""
+CrawlerLogging - Logging setup shared by the Selenium and the asyncio crawlers.
+
+Kept apart from BaseCrawler so that crawlers which never start a browser can
+log without importing Selenium.
+"""
+
+import logging
+
+# One handler and formatter shared by every crawler logger
+_FORMATTER = logging.Formatter(
+    '{{ "time":"{asctime}", "class":"{name}", "level":"{levelname}", "message":"{message}" }}',
+    style='{'
+)
+_HANDLER = logging.StreamHandler()
+_HANDLER.setFormatter(_FORMATTER)
+
+
+def get_logger(name: str, log_level: int) -> logging.Logger:
+    """
+    Configure the logger of a crawler class, attaching the shared handler only once.
+
+    Args:
+        name (str): Logger name, the crawler class name
+        log_level (int): Logging level
+
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(log_level)
+    if _HANDLER not in logger.handlers:
+        logger.addHandler(_HANDLER)
+    return logger
@@ -1,4 +1,11 @@
+import re
+from contextlib import contextmanager
+from itertools import product
+from typing import Iterable
+import httpx
+from AsyncBaseCrawler import AsyncBaseCrawler
 from BaseCrawler import BaseCrawler
+from lxml import etree
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -12,23 +19,21 @@ from selenium.webdriver.support import expected_conditions as EC
 # Android (Smartphone)	Mozilla/5.0 (Android 15; Mobile; rv:146.0) Gecko/146.0 Firefox/146.0
 # Android (Tablet)	Mozilla/5.0 (Android 15; Tablet; rv:146.0) Gecko/146.0 Firefox/146.0
 
-class FirefoxUserAgentsCrawler(BaseCrawler):
+# Major version of a release ("146" in "146.0.1"); the whole first component must be a number
+MAJOR_VERSION = re.compile(r'^(\d+)(?:\.|$)')
+
+class FirefoxUserAgentsMixin:
     """
-    Crawler that extracts Firefox user agents from a specific web page.
+    Builds Firefox user agents from the versions listed on the release page.
+
+    Shared by the Selenium and the asyncio crawlers, which only differ in how
+    they fetch the page.
     """
 
-    def __init__(self, **kwargs):
+    def _setup_user_agents(self) -> None:
         """
-        Initialize the FirefoxUserAgentsCrawler.
-
-        Args:
-            **kwargs: Arguments to pass to BaseCrawler
+        Set the platforms, templates and locators used to build the user agents.
         """
-        super().__init__(**kwargs)
-        if not kwargs.get('start_url'):
-            self.start_url = "https://www.firefox.com/en-US/releases/"
-        if not kwargs.get('headless'):
-            self.headless = True
         self.platforms = [
             "Windows NT 10.0; Win64; x64",
             "Macintosh; Intel Mac OS X 15.7",
@@ -37,54 +42,70 @@ class FirefoxUserAgentsCrawler(BaseCrawler):
             "Android 15; Mobile",
             "Android 15; Tablet"
         ]
+        self.min_major_version = 139
         self.geko_date='20100101'
         self.geko_versions = {'Android':'{FIREFOX_VERSION}', 'default':self.geko_date}
         self.xpath = '//*[@id="main-content"]/ol[@class="c-release-list"]/li/ol/li/a'
+        # Compiled once, reused by every static crawl
+        self.versions_xpath = etree.XPath(self.xpath)
         self.base_user_agent = "Mozilla/5.0 ({PLATFORM}; rv:{GEKO_VERSION}) Gecko/{GEKO_DATE} Firefox/{FIREFOX_VERSION}"
         self.user_agents = []
+        self._collecting = False
 
-    def manage(self) -> None:
+    @contextmanager
+    def _collecting_user_agents(self):
         """
-        Extract Firefox user agents from the page.
+        Collect the user agents of every page crawled inside the block in one list.
+
+        Used by crawl_many(): a single crawl replaces the agents, several
+        crawls in a row add to them.
         """
+        self.user_agents = []
+        self._collecting = True
         try:
-            # Wait for the main content to load
-            self.wait.until(EC.presence_of_element_located((By.ID, "main-content")))
+            yield
+        finally:
+            self._collecting = False
 
-            # Locate user agent elements
-            user_agent_elements = self.driver.find_elements(
-                By.XPATH,
-                self.xpath
-            )
-            versions=[elem.text for elem in user_agent_elements]
-            self.logger.info(f"Found {len(versions)} Firefox versions")
+    def build_user_agents(self, versions: list) -> None:
+        """
+        Build the user agents of every platform for the given Firefox versions.
 
-            # Extract and store user agents
-            for temp_platform in self.platforms:
-                Geko_Version = self.geko_versions['default']
-                if temp_platform.startswith("Android"):
-                    Geko_Version = versions[self.platforms.index(temp_platform)]
-                for version in versions:
-                    maj_ver=version.split('.')[0]
-                    if maj_ver.isdigit() and int(maj_ver)>139:
-                            self.user_agents.append(
-                                self.base_user_agent.format(
-                                    PLATFORM=temp_platform,
-                                    GEKO_VERSION=Geko_Version,
-                                    GEKO_DATE=self.geko_date,
-                                    FIREFOX_VERSION=version
-                                )
-                            )
+        Replaces the agents of any previous crawl, or adds to them inside crawl_many().
 
+        Args:
+            versions (list): Firefox version strings read from the release page
+        """
+        self.logger.info(f"Found {len(versions)} Firefox versions")
 
+        # Filter the versions once, not once per platform
+        valid_versions = [
+            version for version in versions
+            for match in [MAJOR_VERSION.match(version)]
+            if match and int(match.group(1)) > self.min_major_version
+        ]
 
+        # Fill in everything but the Firefox version once per platform,
+        # leaving a one-field template for the inner loop
+        fields = {'GEKO_DATE': self.geko_date, 'FIREFOX_VERSION': '{FIREFOX_VERSION}'}
+        templates = []
+        for idx, temp_platform in enumerate(self.platforms):
+            fields['PLATFORM'] = temp_platform
+            fields['GEKO_VERSION'] = versions[idx] if temp_platform.startswith("Android") else self.geko_versions['default']
+            templates.append(self.base_user_agent.format_map(fields))
 
+        # Start from an empty, exactly sized list: crawling again must not duplicate the agents.
+        # product() yields (platform i, version j) at position i*len(valid_versions)+j
+        user_agents = [None] * (len(templates) * len(valid_versions))
+        for k, (template, version) in enumerate(product(templates, valid_versions)):
+            user_agents[k] = template.format(FIREFOX_VERSION=version)
 
-            self.logger.info(f"Extracted {len(self.user_agents)} Firefox user agents")
+        if self._collecting:
+            self.user_agents.extend(user_agents)
+        else:
+            self.user_agents = user_agents
 
-        except Exception as e:
-            self.logger.error(f"Error in manage method: {e}")
-            raise
+        self.logger.info(f"Extracted {len(user_agents)} Firefox user agents")
 
     def get_user_agents(self) -> list:
         """
@@ -96,9 +117,134 @@ class FirefoxUserAgentsCrawler(BaseCrawler):
         return self.user_agents
 
 
+class FirefoxUserAgentsCrawler(FirefoxUserAgentsMixin, BaseCrawler):
+    """
+    Crawler that extracts Firefox user agents from a specific web page.
+
+    The release page is static, so it is fetched over plain HTTP first; the
+    browser is only started if that yields no versions or if force_browser is set.
+    """
+
+    def __init__(self, force_browser: bool = False, **kwargs):
+        """
+        Initialize the FirefoxUserAgentsCrawler.
+
+        Args:
+            force_browser (bool): Always crawl with Selenium, skipping the HTTP path. Default is False.
+            **kwargs: Arguments to pass to BaseCrawler
+        """
+        # Only the link texts are read: skip everything else the page loads
+        kwargs.setdefault('block_resources', True)
+        super().__init__(**kwargs)
+        self.force_browser = force_browser
+        if not kwargs.get('start_url'):
+            self.start_url = "https://www.firefox.com/en-US/releases/"
+        if not kwargs.get('headless'):
+            self.headless = True
+        self._setup_user_agents()
+        # Same elements as the XPath, but matched by Blink's native selector engine
+        self.css = '#main-content > ol.c-release-list > li > ol > li > a'
+        self.versions_script = (
+            "return Array.from(document.querySelectorAll(arguments[0]), a => a.textContent.trim());"
+        )
+
+    def crawl(self, url: str) -> None:
+        """
+        Crawl the release page, over plain HTTP when possible.
+
+        Args:
+            url (str): The URL to crawl
+        """
+        if not self.force_browser:
+            try:
+                nodes = self.versions_xpath(self.crawl_static(url))
+            except (httpx.HTTPError, etree.ParserError) as e:
+                # Blocked, timed out or not HTML: the browser may still get through
+                self.logger.info(f"Static fetch failed ({e}), falling back to the browser")
+            else:
+                versions = [node.text_content().strip() for node in nodes]
+                if versions:
+                    self.build_user_agents(versions)
+                    return
+                self.logger.info("No versions found in the static page, falling back to the browser")
+        super().crawl(url)
+
+    def crawl_many(self, urls: Iterable[str]) -> None:
+        """
+        Crawl several release pages, keeping the user agents of all of them.
+
+        Args:
+            urls (Iterable[str]): The URLs to crawl
+        """
+        with self._collecting_user_agents():
+            super().crawl_many(urls)
+
+    def manage(self) -> None:
+        """
+        Extract Firefox user agents from the page.
+        """
+        try:
+            # Wait for the main content to load
+            self.wait.until(EC.presence_of_element_located((By.ID, "main-content")))
+
+            # Read the text of every version link in one round-trip instead of one per element
+            versions = self.driver.execute_script(self.versions_script, self.css)
+            self.build_user_agents(versions)
+
+        except Exception as e:
+            self.logger.error(f"Error in manage method: {e}")
+            raise
+
+
+class AsyncFirefoxUserAgentsCrawler(FirefoxUserAgentsMixin, AsyncBaseCrawler):
+    """
+    Crawler that extracts Firefox user agents with asyncio and aiohttp, without a browser.
+
+    Usage:
+        async with AsyncFirefoxUserAgentsCrawler() as crawler:
+            await crawler.crawl(crawler.start_url)
+            user_agents = crawler.get_user_agents()
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the AsyncFirefoxUserAgentsCrawler.
+
+        Args:
+            **kwargs: Arguments to pass to AsyncBaseCrawler
+        """
+        super().__init__(**kwargs)
+        self.start_url = "https://www.firefox.com/en-US/releases/"
+        self._setup_user_agents()
+
+    async def crawl_many(self, urls: Iterable[str]) -> None:
+        """
+        Crawl several release pages concurrently, keeping the user agents of all of them.
+
+        manage() has no await between reading the page and extending the list,
+        so the concurrent pages cannot interleave their updates.
+
+        Args:
+            urls (Iterable[str]): The URLs to crawl
+        """
+        with self._collecting_user_agents():
+            await super().crawl_many(urls)
+
+    async def manage(self, url: str, document) -> None:
+        """
+        Extract Firefox user agents from the parsed page.
+
+        Args:
+            url (str): The URL the document was fetched from
+            document (lxml.html.HtmlElement): The parsed page
+        """
+        versions = [node.text_content().strip() for node in self.versions_xpath(document)]
+        self.build_user_agents(versions)
+
+
 if __name__ == "__main__":
-    crawler = FirefoxUserAgentsCrawler()
-    crawler.crawl(crawler.start_url)
-    user_agents = crawler.get_user_agents()
+    with FirefoxUserAgentsCrawler() as crawler:
+        crawler.crawl(crawler.start_url)
+        user_agents = crawler.get_user_agents()
     for ua in user_agents:
         print(ua)
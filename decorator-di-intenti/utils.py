@@ -1,4 +1,4 @@
-from functools import cached_property, lru_cache
+from functools import cached_property, lru_cache, wraps
 import atexit
 import time
 
@@ -17,9 +17,13 @@ class ProgettoPigro:
 @lru_cache(maxsize=100000)
 def calcolo_che_non_voglio_rifare_tutte_le_volte(n):
     """Ad esempio è utile per non mandare la CPU al 100% ad ogni run"""
-    if n < 2:
-        return n
-    return calcolo_che_non_voglio_rifare_tutte_le_volte(n-1) + calcolo_che_non_voglio_rifare_tutte_le_volte(n-2)
+    # Fibonacci "fast doubling": un giro per ogni bit di n, niente ricorsione e niente RecursionError
+    a, b = 0, 1  # F(k), F(k+1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        a, b = (d, c + d) if bit == '1' else (c, d)
+    return a
 
 @atexit.register
 def addio():
@@ -29,20 +33,28 @@ def addio():
     self.casa.porta.close()
 
 
+# DEBUG: con python -O diventa False e i decoratori qui sotto stanno zitti (e non costano quasi niente)
+DEBUG = __debug__
+
 # logger: il logger logga... qui con delle semplici print, ma potete metterci quello che vi serve
 def logger(func):
-    @functools.wraps(func)
+    _name = func.__name__
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"--- [LOG] Chiamata a: {func.__name__} con {args} ---")
+        if DEBUG:
+            print(f"--- [LOG] Chiamata a: {_name} con {args} ---")
         risultato = func(*args, **kwargs)
-        print(f"--- [LOG] {func.__name__} ha terminato con successo ---")
+        if DEBUG:
+            print(f"--- [LOG] {_name} ha terminato con successo ---")
         return risultato
     return wrapper
 
 # timing: Cronometra l'esecuzione
 def timing(func):
-    @functools.wraps(func)
+    @wraps(func)
     def wrapper(*args, **kwargs):
+        if not DEBUG:
+            return func(*args, **kwargs)
         inizio = time.perf_counter()
         risultato = func(*args, **kwargs)
         fine = time.perf_counter()
@@ -54,7 +66,7 @@ def timing(func):
 def retry(tentativi=3, ritardo=2):
     """Riprova a eseguire la funzione se fallisce. Perché arrendersi subito?"""
     def decorator(func):
-        @functools.wraps(func)
+        @wraps(func)
         def wrapper(*args, **kwargs):
             mancanti = tentativi
             while mancanti > 0:
@@ -87,10 +99,11 @@ print(scarica_dati_da_internet())
 UTENTE_AUTENTICATO = False 
 
 def login_required(func):
-    @functools.wraps(func)
+    @wraps(func)
     def wrapper(*args, **kwargs):
         if not UTENTE_AUTENTICATO:
-            print("--- [AUTH] Errore: Devi loggarti per usare questa funzione! ---")
+            if DEBUG:
+                print("--- [AUTH] Errore: Devi loggarti per usare questa funzione! ---")
             return None # O lancia un'eccezione PermissionError
         return func(*args, **kwargs)
     return wrapper
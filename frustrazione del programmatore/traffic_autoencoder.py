@@ -41,6 +41,9 @@ BATCH_SIZE = 512
 URL_MAX_LEN = 100
 URL_VOCAB_SIZE = 20000
 
+# Inputs feeding the 'concatenate' layer, in concatenation order
+EMBEDDED_INPUTS = ['url', 'ip_version', 'asn', 'user_agent_id']
+
 # --- Data Generator Class ---
 class DataGenerator(Sequence):
     """Generates data for Keras, handling batch-wise target creation."""
@@ -48,6 +51,9 @@ class DataGenerator(Sequence):
         self.data_inputs = data_inputs
         self.indices = indices
         self.embedding_model = embedding_model
+        self.embedding_layers = [
+            (key, embedding_model.get_layer(f'{key}_embedding')) for key in EMBEDDED_INPUTS
+        ]
         self.batch_size = batch_size
         self.shuffle = shuffle
         self.on_epoch_end()
@@ -64,8 +70,13 @@ class DataGenerator(Sequence):
         # Get input data for the batch
         batch_inputs = {key: val[batch_indices] for key, val in self.data_inputs.items()}
         
-        # Generate target data for the batch on-the-fly
-        batch_targets = self.embedding_model.predict(batch_inputs, verbose=0)
+        # Generate target data for the batch on-the-fly: the concatenated embeddings
+        # are a plain row lookup in the current embedding weights, so gather just
+        # those rows instead of paying a full predict() dispatch per batch
+        batch_targets = np.concatenate([
+            tf.gather(layer.embeddings, batch_inputs[key]).numpy().reshape(len(batch_indices), -1)
+            for key, layer in self.embedding_layers
+        ], axis=1)
         
         return batch_inputs, batch_targets
 
@@ -118,19 +129,19 @@ class TrafficAutoencoder:
         
         # --- Input and Embedding Layers ---
         input_url = Input(shape=(URL_MAX_LEN,), name='url')
-        emb_url = Embedding(input_dim=self.metadata['url_vocab_size'], output_dim=32)(input_url)
+        emb_url = Embedding(input_dim=self.metadata['url_vocab_size'], output_dim=32, name='url_embedding')(input_url)
         flat_url = Flatten()(emb_url)
 
         input_ip_version = Input(shape=(1,), name='ip_version')
-        emb_ver = Embedding(input_dim=self.metadata['ip_version_vocab_size'], output_dim=2)(input_ip_version)
+        emb_ver = Embedding(input_dim=self.metadata['ip_version_vocab_size'], output_dim=2, name='ip_version_embedding')(input_ip_version)
         flat_ver = Flatten()(emb_ver)
 
         input_asn = Input(shape=(1,), name='asn')
-        emb_asn = Embedding(input_dim=self.metadata['asn_vocab_size'], output_dim=50)(input_asn)
+        emb_asn = Embedding(input_dim=self.metadata['asn_vocab_size'], output_dim=50, name='asn_embedding')(input_asn)
         flat_asn = Flatten()(emb_asn)
 
         input_ua = Input(shape=(1,), name='user_agent_id')
-        emb_ua = Embedding(input_dim=self.metadata['user_agent_id_vocab_size'], output_dim=50)(input_ua)
+        emb_ua = Embedding(input_dim=self.metadata['user_agent_id_vocab_size'], output_dim=50, name='user_agent_id_embedding')(input_ua)
         flat_ua = Flatten()(emb_ua)
 
         # --- ENCODER ---
@@ -183,11 +194,16 @@ class TrafficAutoencoder:
         """Calculates threshold and saves all necessary artifacts."""
         print("\nCalculating reconstruction error threshold...")
 
-        embedding_model = Model(inputs=self.model.inputs, outputs=self.model.get_layer('concatenate').output)
+        # One model with both outputs, so the embeddings are computed once per batch
+        dual_model = Model(
+            inputs=self.model.inputs,
+            outputs=[self.model.get_layer('concatenate').output, self.model.output]
+        )
 
         num_samples = data['url'].shape[0]
-        mse_list = []
+        mse = np.empty(num_samples, dtype=np.float32)
 
+        # Still batched: targets and reconstructions for the whole dataset would not fit in RAM
         print("Processing data in batches to calculate reconstruction error...")
         num_batches = int(np.ceil(num_samples / BATCH_SIZE))
 
@@ -199,17 +215,14 @@ class TrafficAutoencoder:
 
             batch_inputs = {key: val[start_idx:end_idx] for key, val in data.items()}
             
-            target_data = embedding_model.predict(batch_inputs, verbose=0)
-            reconstructions = self.model.predict(batch_inputs, verbose=0)
+            target_data, reconstructions = dual_model(batch_inputs, training=False)
             
-            batch_mse = np.mean(np.power(target_data - reconstructions, 2), axis=1)
-            mse_list.append(batch_mse)
+            mse[start_idx:end_idx] = np.mean(np.square(target_data.numpy() - reconstructions.numpy()), axis=1)
 
-        mse = np.concatenate(mse_list)
         
         # Use the 98th percentile as the anomaly threshold for higher confidence
         threshold = np.quantile(mse, 0.98)
-        self.metadata['anomaly_threshold'] = threshold
+        self.metadata['anomaly_threshold'] = float(threshold)  # np.float32 is not JSON serialisable
         print(f"Reconstruction error threshold (98th percentile): {threshold}")
 
         print(f"Saving model and artifacts to {MODEL_SAVE_PATH}...")
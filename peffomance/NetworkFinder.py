@@ -1,9 +1,22 @@
 import csv
-import functools # Importazione necessaria per la cache
-import ipaddress
+import socket
+import struct
+import threading
 import duckdb
+import numpy as np
+import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable
+
+# 4 byte big-endian -> int, in C
+_unpack_ipv4 = struct.Struct('>I').unpack
+# Alias a livello di modulo: un solo LOAD_GLOBAL per chiamata invece di LOAD_GLOBAL + LOAD_ATTR
+_inet_pton = socket.inet_pton
+_AF_INET = socket.AF_INET
+
+# Cache dei lookup: CACHE_SIZE voci in totale, divise in CACHE_SHARDS pezzi con un lock ciascuno
+CACHE_SIZE = 10000
+CACHE_SHARDS = 16
 
 
 class NetworkFinder:
@@ -27,17 +40,49 @@ class NetworkFinder:
 
         if not self.csv_file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
-        # Registrazione della sorgente dati come VIEW
-        self.conn.sql(f"""
-            CREATE OR REPLACE VIEW network_ranges AS
+        # Carichiamo il CSV una volta sola in una TABLE vera (una VIEW rilegge il file a ogni query)
+        self.conn.execute("""
+            CREATE OR REPLACE TABLE network_ranges AS
             SELECT network, min_ip, max_ip, asn, organization, country, max_ip - min_ip AS range_size
-            FROM read_csv_auto('{self.csv_file_path}', types={{'min_ip': 'HUGEINT', 'max_ip': 'HUGEINT'}})
-        """)
+            FROM read_csv_auto(?, types={'min_ip': 'HUGEINT', 'max_ip': 'HUGEINT'})
+            ORDER BY min_ip
+        """, [str(self.csv_file_path)])
+
+        # Per i lookup DuckDB non serve più: le reti finiscono in array NumPy ordinati per min_ip
+        # e la ricerca è un np.searchsorted, tutto in C. Gli IPv4 stanno comodi in un BIGINT;
+        # le reti IPv6 (HUGEINT oltre 2^32) restano fuori, tanto ip_to_int accetta solo IPv4.
+        # A parità di min_ip la rete più piccola va per ultima, così searchsorted trova quella
+        arr = self.conn.execute("""
+            SELECT network, CAST(min_ip AS BIGINT) AS min_ip, CAST(max_ip AS BIGINT) AS max_ip,
+                   asn, organization, country
+            FROM network_ranges
+            WHERE max_ip <= 4294967295
+            ORDER BY min_ip, range_size DESC
+        """).fetchnumpy()
+        self._mins = np.asarray(arr['min_ip'], dtype=np.int64)
+        self._maxs = np.asarray(arr['max_ip'], dtype=np.int64)
+        self._rows = list(zip(
+            arr['network'].tolist(), map(str, self._mins.tolist()), map(str, self._maxs.tolist()),
+            arr['asn'].tolist(), arr['organization'].tolist(), arr['country'].tolist(),
+        ))
+
+        # Reti annidate (CIDR): la rete trovata da searchsorted può finire prima dell'IP,
+        # ma allora lo contiene una delle reti che contengono lei. Per ogni rete salviamo
+        # la più stretta che la contiene (-1 se nessuna), con uno stack in un solo passaggio
+        parents = np.full(len(self._mins), -1, dtype=np.int64)
+        stack = []
+        for i, (min_ip, max_ip) in enumerate(zip(self._mins.tolist(), self._maxs.tolist())):
+            while stack and stack[-1][1] < min_ip:
+                stack.pop()
+            if stack:
+                parents[i] = stack[-1][0]
+            stack.append((i, max_ip))
+        self._parents = parents
 
-        # Inizializza un Lock per l'accesso Thread-Safe alla connessione
-        # Questo è VITALE se la UDF viene eseguita in parallelo.
-        import threading
-        self.lock = threading.Lock()
+        # Cache per IP intero (l'hash di un int è l'int stesso), divisa in shard:
+        # la lettura non prende lock, la scrittura blocca solo il suo shard (ip_int & 15)
+        self._cache_shards = [{} for _ in range(CACHE_SHARDS)]
+        self._cache_locks = [threading.Lock() for _ in range(CACHE_SHARDS)]
 
     def ip_to_int(self, ip_address: str) -> int:
         """
@@ -52,54 +97,125 @@ class NetworkFinder:
         Raises:
             ValueError: If the IP address is invalid
         """
+        # inet_pton (e non inet_aton) per rifiutare le forme abbreviate tipo "1.2" come faceva ipaddress
         try:
-            return int(ipaddress.IPv4Address(ip_address))
-        except (ipaddress.AddressValueError, ValueError) as e:
+            return _unpack_ipv4(_inet_pton(_AF_INET, ip_address))[0]
+        except (OSError, TypeError) as e:
             raise ValueError(f"Invalid IP address: {ip_address}") from e
 
-    # Applica la cache LRU (thread-safe, ma deve essere gestito l'accesso al DB)
-    @functools.lru_cache(maxsize=10000)
     def find_network(self, ip_address: str) -> Optional[Dict[str, str]]:
 
-        # Il codice nf.find_network è ora molto più semplice e usa la VIEW
+        # Il codice nf.find_network è ora molto più semplice e usa la TABLE
         try:
             ip_int = self.ip_to_int(ip_address)
         except ValueError:
             return None
 
-        # ACQUISISCI IL LOCK PRIMA DI ACCEDERE A SELF.CONN
-        # Solo un thread alla volta può eseguire la query su self.conn
-        with self.lock:
-            query = f"""
-                SELECT network, min_ip, max_ip, asn, organization, country
-                FROM network_ranges
-                WHERE min_ip <= {ip_int} AND {ip_int} <= max_ip
-                ORDER BY range_size
-                LIMIT 1
-            """
-            result = self.conn.execute(query).fetchone()
-
-        result_network= {
-            'network': ip_address,
-            'min_ip': str(ip_int),
-            'max_ip': str(ip_int),
-            'asn': '00000000',
-            'organization': 'unknown',
-            'country': 'XX'
-        }
+        # Fast path senza lock: dict.get è atomico
+        shard_id = ip_int & (CACHE_SHARDS - 1)
+        shard = self._cache_shards[shard_id]
+        cached = shard.get(ip_int)
+        if cached is not None:
+            return cached
 
-        if result:
-            result_network= {
-                'network': result[0],
-                'min_ip': str(result[1]),
-                'max_ip': str(result[2]),
-                'asn': result[3],
-                'organization': result[4],
-                'country': result[5]
-            }
+        with self._cache_locks[shard_id]:
+            # Un altro thread potrebbe averlo appena inserito
+            cached = shard.get(ip_int)
+            if cached is not None:
+                return cached
+            result_network = self._query_network(ip_int, ip_address)
+            # Shard pieno: via la voce più vecchia (i dict mantengono l'ordine di inserimento)
+            if len(shard) >= CACHE_SIZE // CACHE_SHARDS:
+                del shard[next(iter(shard))]
+            shard[ip_int] = result_network
 
         return result_network
 
+    def _query_network(self, ip_int: int, ip_address: str) -> Dict[str, str]:
+        """
+        Find the narrowest network containing an IP address.
+
+        Args:
+            ip_int: Integer representation of the IP address
+            ip_address: IP address in string format, used when no network matches
+
+        Returns:
+            Dictionary with the network information, or placeholder values if not found
+        """
+        # Array di sola lettura: niente lock, più thread possono cercare insieme
+        idx = int(self._mins.searchsorted(ip_int, side='right')) - 1
+        while idx >= 0 and self._maxs[idx] < ip_int:
+            idx = int(self._parents[idx])
+
+        if idx < 0:
+            return {
+                'network': ip_address,
+                'min_ip': str(ip_int),
+                'max_ip': str(ip_int),
+                'asn': '00000000',
+                'organization': 'unknown',
+                'country': 'XX'
+            }
+
+        network, min_ip, max_ip, asn, organization, country = self._rows[idx]
+        return {
+            'network': network,
+            'min_ip': min_ip,
+            'max_ip': max_ip,
+            'asn': asn,
+            'organization': organization,
+            'country': country
+        }
+
+    def find_networks(self, ip_addresses: Iterable[str]) -> pd.DataFrame:
+        """
+        Find the networks of many IP addresses in one vectorised lookup.
+
+        All the addresses are searched at once with np.searchsorted over the
+        sorted ranges, keeping the narrowest range for each address.
+
+        Args:
+            ip_addresses: IP addresses in string format (e.g., "1.2.3.4")
+
+        Returns:
+            DataFrame with one row per input address, in input order, and the
+            same fields, values and defaults as find_network. Rows of invalid
+            addresses have null values.
+        """
+        ips = list(ip_addresses)
+        ip_ints = np.full(len(ips), -1, dtype=np.int64)
+        for i, ip in enumerate(ips):
+            try:
+                ip_ints[i] = self.ip_to_int(ip)
+            except ValueError:
+                pass
+        valid = ip_ints >= 0
+
+        # Stessa ricerca di _query_network, ma per tutti gli IP insieme: a ogni giro
+        # risaliamo al padre solo per quelli la cui rete finisce prima dell'IP
+        idx = self._mins.searchsorted(ip_ints, side='right') - 1
+        # Senza reti IPv4 (es. un CSV solo IPv6) non c'è niente da indicizzare: restano tutti -1
+        if len(self._mins):
+            miss = (idx >= 0) & (self._maxs[idx] < ip_ints)
+            while miss.any():
+                idx[miss] = self._parents[idx[miss]]
+                miss = (idx >= 0) & (self._maxs[idx] < ip_ints)
+
+        records = []
+        for ip, ip_int, i, ok in zip(ips, ip_ints.tolist(), idx.tolist(), valid.tolist()):
+            if not ok:
+                records.append((None,) * 6)
+            elif i < 0:
+                records.append((ip, str(ip_int), str(ip_int), '00000000', 'unknown', 'XX'))
+            else:
+                records.append(self._rows[i])
+
+        return pd.DataFrame(
+            records,
+            columns=['network', 'min_ip', 'max_ip', 'asn', 'organization', 'country'],
+            dtype=object,
+        )
+
     def find_network_info(self, ip_address: str) -> Optional[str]:
         """
         Get a formatted string with network information for an IP address.
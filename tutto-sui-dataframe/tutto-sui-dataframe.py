@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from contextlib import contextmanager
 import time
@@ -88,16 +89,33 @@ colonne_utili = ['manufacturer', 'model', 'name']
 
 with timer("Estrazione dei dati"):
     # Leggiamo solo le colonne utili: risparmio di RAM istantaneo.
-    df = pd.read_csv('csv/20241225/list.csv', usecols=colonne_utili)
-    df = pd.concat([df] * 1000, ignore_index=True)
-
-# TRUCCO FINALE: Le Categorie.
-# Invece di scrivere "Volkswagen" 269.000 volte, usiamo un codice numerico.
-# È come usare i gettoni al posto delle banconote: pesano meno.
-df['manufacturer'] = df['manufacturer'].astype('category')
-
-# Re-impostiamo l'indice sulla versione "light" del DataFrame
-df.set_index(['manufacturer', 'model'], inplace=True)
+    # E lo facciamo col motore pyarrow: parser multi-thread e stringhe Arrow compatte
+    # invece di un oggetto Python per ogni cella.
+    df = pd.read_csv('csv/20241225/list.csv', usecols=colonne_utili,
+                     engine='pyarrow', dtype_backend='pyarrow')
+
+    # TRUCCO FINALE: Le Categorie.
+    # Invece di scrivere "Volkswagen" 269.000 volte, usiamo un codice numerico.
+    # È come usare i gettoni al posto delle banconote: pesano meno.
+    # E già che ci siamo anche modello e nome: con i livelli categorici l'indice
+    # confronta codici interi invece di stringhe, una Python alla volta.
+    df = df.astype('category')
+
+    # E solo ora moltiplichiamo x1000: ma copiamo i gettoni, non le banconote.
+    # np.tile ripete i codici interi e costruiamo direttamente il MultiIndex,
+    # senza passare da concat e set_index sulle stringhe.
+    # from_arrays con delle Categorical tiene i livelli categorici, come farebbe set_index.
+    moltiplicate = {
+        col: pd.Categorical.from_codes(np.tile(df[col].cat.codes.to_numpy(), 1000), dtype=df[col].dtype)
+        for col in colonne_utili
+    }
+    indice = pd.MultiIndex.from_arrays(
+        [moltiplicate['manufacturer'], moltiplicate['model']],
+        names=['manufacturer', 'model'],
+    )
+    df = pd.DataFrame({'name': moltiplicate['name']}, index=indice)
+
+# La versione "light" del DataFrame ha già il suo indice: resta solo da ordinarlo
 df.sort_index(inplace=True)
 
 memoria_totale = df.memory_usage(deep=True).sum()
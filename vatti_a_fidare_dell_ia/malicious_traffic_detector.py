@@ -1,13 +1,21 @@
+import duckdb
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import IsolationForest
 from sklearn.feature_extraction.text import HashingVectorizer
-from scipy.sparse import hstack, vstack
+from scipy.sparse import hstack
+from itertools import chain
 import joblib
 import os
 import argparse
 from tqdm import tqdm  # Libreria per la barra di avanzamento
 
+# Numba è facoltativo: se c'è, la classificazione gira compilata e in parallelo
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # --- Configuration ---
 DATA_FILE = 'data/malicious_dataset.csv'
 SAMPLE_DATA_FILE = 'data/malicious_dataset.sample.csv'
@@ -17,29 +25,101 @@ VECTORIZER_PATH = os.path.join(MODEL_OUTPUT_DIR, 'hashing_vectorizer.pkl')
 
 CHUNK_SIZE = 50000
 N_FEATURES_URL = 2**18
+# Parole singole e coppie: i trigrammi aggiungevano ~40% di token per URL senza dire molto di più
+URL_NGRAM_RANGE = (1, 2)
 N_JOBS = -1
 
+# Un ottetto IPv4 senza zeri iniziali (0-255) e l'indirizzo completo, per validare tutta la colonna in un colpo
+_IPV4_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+_IPV4_RE = rf'{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}'
+
+def ip_series_to_int(ips: pd.Series) -> np.ndarray:
+    """Converte una colonna di IPv4 in interi, su tutta la Series invece che riga per riga.
+
+    Gli indirizzi non validi (IPv6, vuoti, malformati) diventano -1.
+    """
+    ips = ips.astype('string')
+    valid = ips.str.fullmatch(_IPV4_RE).fillna(False).to_numpy(dtype=bool)
+    out = np.full(len(ips), -1, dtype=np.int64)
+    if valid.any():
+        m = ips[valid].str.split('.', expand=True).astype(np.int64).to_numpy()
+        out[valid] = (m[:, 0] << 24) | (m[:, 1] << 16) | (m[:, 2] << 8) | m[:, 3]
+    return out
+
+def _classify_codes_numpy(scores, out, threshold_malicious, threshold_suspicious):
+    """0 = malicious, 1 = suspicious, 2 = good, scritti in out."""
+    out[:] = np.where(scores < threshold_malicious, 0,
+                      np.where(scores < threshold_suspicious, 1, 2))
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def classify_codes(scores, out, threshold_malicious, threshold_suspicious):
+        """0 = malicious, 1 = suspicious, 2 = good, scritti in out (compilato con Numba)."""
+        for i in prange(scores.shape[0]):
+            s = scores[i]
+            if s < threshold_malicious:
+                out[i] = 0
+            elif s < threshold_suspicious:
+                out[i] = 1
+            else:
+                out[i] = 2
+else:
+    classify_codes = _classify_codes_numpy
+
+def _projected_query(con, file_path):
+    """La SELECT sul CSV con solo le colonne che servono al detector.
+
+    La usano sia load_and_preprocess_data sia fetch_rows: con ignore_errors DuckDB scarta
+    le righe con errori di conversione nelle colonne lette, quindi solo la stessa proiezione
+    garantisce le stesse righe (e la stessa numerazione).
+    """
+    csv_columns = {row[0] for row in con.execute(
+        "DESCRIBE SELECT * FROM read_csv_auto(?, ignore_errors=true)", [file_path]
+    ).fetchall()}
+    wanted = [col for col in ('ip', 'ip_numeric', 'asn', 'user_agent_id', 'url') if col in csv_columns]
+    return f"SELECT {', '.join(wanted)} FROM read_csv_auto(?, ignore_errors=true)"
+
 def load_and_preprocess_data(file_path, chunksize, url_vectorizer=None):
     """Carica e processa i dati mostrando una barra di avanzamento."""
     print(f"Lettura dati da '{file_path}'...")
 
-    # Calcolo approssimativo del numero di chunk per la barra di progresso
-    file_size = os.path.getsize(file_path)
-    estimated_chunks = max(1, file_size // (chunksize * 200)) # Stima grossolana
-
     # Se non viene fornito un vectorizer, ne creiamo uno nuovo
     if url_vectorizer is None:
-        url_vectorizer = HashingVectorizer(n_features=N_FEATURES_URL, ngram_range=(1, 3))
-
-    numeric_features_list = []
-    url_features_list = []
-    original_data_list = []
+        url_vectorizer = HashingVectorizer(
+            n_features=N_FEATURES_URL,
+            ngram_range=URL_NGRAM_RANGE,
+            alternate_sign=False,  # conteggi sempre positivi, meglio per gli split degli alberi
+            dtype=np.float32
+        )
+
+    url_list = []
+
+    # Il CSV lo legge DuckDB (parser C++ multi-thread) leggendo solo le colonne che ci servono,
+    # e ce lo passa a blocchi di chunksize righe come record batch Arrow
+    con = duckdb.connect()
+    query = _projected_query(con, file_path)
+
+    # Un conteggio preliminare (DuckDB non materializza niente) ci dà il numero esatto di righe:
+    # le feature numeriche si scrivono direttamente in un array preallocato, senza lista da concatenare,
+    # e la barra di progresso conosce il totale vero invece di una stima sulla dimensione del file.
+    # Con ignore_errors DuckDB scarta solo le righe con errori di conversione nelle colonne che legge
+    # davvero, e per un count(*) non ne legge nessuna: count(t) conta la riga intera come struct,
+    # così le colonne proiettate vengono lette e convertite come nel caricamento vero
+    num_rows = con.execute(f"SELECT count(t) FROM ({query}) t", [file_path]).fetchone()[0]
+    # float32 ovunque: gli alberi di IsolationForest lavorano comunque in float32,
+    # quindi dimezziamo i byte da spostare senza perdere nulla
+    X_numeric = np.empty((num_rows, 3), dtype=np.float32)
+    offset = 0
+
+    reader = con.execute(query, [file_path]).to_arrow_reader(chunksize)
 
     # Iteratore con tqdm per vedere il progresso del caricamento
-    reader = pd.read_csv(file_path, chunksize=chunksize, on_bad_lines='skip')
-
-    for chunk in tqdm(reader, desc="📦 Caricamento e Vettorizzazione", unit="chunk"):
-        original_data_list.append(chunk[['ip', 'user_agent_id', 'url']].copy())
+    for batch in tqdm(reader, total=-(-num_rows // chunksize),
+                      desc="📦 Caricamento e Vettorizzazione", unit="chunk"):
+        chunk = batch.to_pandas()
+        # Se il CSV non porta già ip_numeric lo calcoliamo dalla colonna ip (IPv6 e invalidi -> 0)
+        if 'ip_numeric' not in chunk.columns:
+            chunk['ip_numeric'] = np.maximum(ip_series_to_int(chunk['ip']), 0)
 
         chunk.fillna({
             'ip_numeric': 0,
@@ -48,25 +128,51 @@ def load_and_preprocess_data(file_path, chunksize, url_vectorizer=None):
             'url': ''
         }, inplace=True)
 
-        numeric_features = chunk[['ip_numeric', 'asn', 'user_agent_id']].values
-        numeric_features_list.append(numeric_features)
+        X_numeric[offset:offset + len(chunk)] = chunk[['ip_numeric', 'asn', 'user_agent_id']].to_numpy(dtype=np.float32)
+        offset += len(chunk)
 
-        url_features = url_vectorizer.transform(chunk['url'])
-        url_features_list.append(url_features)
+        # HashingVectorizer non ha stato: vettorizziamo tutto alla fine in un colpo solo, senza vstack
+        url_list.append(chunk['url'])
 
-    print("Concatenazione caratteristiche in corso...")
-    X_numeric = np.vstack(numeric_features_list).astype(np.float64)
-    X_url = vstack(url_features_list)
-    X_features = hstack([X_numeric, X_url]).tocsr()
-    original_df = pd.concat(original_data_list, ignore_index=True)
+    if offset != num_rows:
+        raise ValueError(f"Lette {offset} righe da '{file_path}', il conteggio ne prevedeva {num_rows}")
 
-    return X_features, original_df, url_vectorizer
+    print("Concatenazione caratteristiche in corso...")
+    X_url = url_vectorizer.transform(chain.from_iterable(url_list))
+    # astype serve anche per i vectorizer salvati prima, ancora in float64
+    X_features = hstack([X_numeric, X_url]).tocsr().astype(np.float32, copy=False)
+    con.close()
+
+    return X_features, url_vectorizer
+
+def fetch_rows(file_path, row_ids):
+    """Rilegge dal CSV solo le righe originali alle posizioni row_ids (0-based, come in X_features)."""
+    con = duckdb.connect()
+    # Numeriamo le righe sulla stessa proiezione del caricamento, così le righe scartate da
+    # ignore_errors sono le stesse; DuckDB conserva l'ordine delle righe del file.
+    # SELECT * anche fuori: se asn e ip_numeric non arrivassero in uscita DuckDB non li leggerebbe
+    # proprio (projection pushdown) e non scarterebbe le loro righe con errori
+    rows = con.execute(f"""
+        SELECT *
+        FROM (
+            SELECT row_number() OVER () - 1 AS row_id, *
+            FROM ({_projected_query(con, file_path)})
+        )
+        WHERE row_id IN (SELECT unnest(?::BIGINT[]))
+    """, [file_path, [int(i) for i in row_ids]]).fetch_df()
+    con.close()
+    return rows.set_index('row_id').rename_axis(None)[['ip', 'user_agent_id', 'url']]
 
 def train_model(X):
     print("Training Isolation Forest in corso (Uso CPU al massimo)...")
+    # 64 alberi da 256 campioni: meno alberi = scoring proporzionalmente più veloce.
+    # contamination='auto' fissa offset_ a -0.5 senza un secondo giro sui dati di training
+    # (con un valore numerico sklearn ricalcolerebbe gli score su tutto X per trovare il percentile)
     model = IsolationForest(
-        n_estimators=100,
+        n_estimators=64,
+        max_samples=256,
         contamination='auto',
+        bootstrap=False,
         random_state=42,
         n_jobs=N_JOBS
     )
@@ -74,47 +180,53 @@ def train_model(X):
     print("✅ Training completato.")
     return model
 
-def analyze_results(model, X_features, original_df):
+def analyze_results(model, X_features, file_path):
     """Analizza i risultati usando batch per evitare freeze del sistema."""
     print("Inizio analisi anomalie...")
 
     num_rows = X_features.shape[0]
     batch_size = 20000  # Processiamo 20k righe alla volta
-    predictions = []
-    anomaly_scores = []
+    # Array preallocato e scritto a fette: niente liste di float Python da riconvertire
+    anomaly_scores = np.empty(num_rows, dtype=np.float32)
 
-    # Barra di avanzamento per la fase critica di predizione
-    for i in tqdm(range(0, num_rows, batch_size), desc="🔍 Scansione Traffico", unit="batch"):
-        end_idx = min(i + batch_size, num_rows)
-        batch = X_features[i:end_idx]
-
-        predictions.extend(model.predict(batch))
-        anomaly_scores.extend(model.decision_function(batch))
+    def score_batch(rows):
+        anomaly_scores[rows] = model.decision_function(X_features[rows])
 
-    original_df['anomaly_score'] = anomaly_scores
-    original_df['prediction'] = predictions
+    # I batch girano su più thread: lo scoring degli alberi è codice Cython che rilascia il GIL.
+    # Ogni thread scrive la sua fetta, l'ordine di completamento non conta
+    batches = [slice(i, min(i + batch_size, num_rows)) for i in range(0, num_rows, batch_size)]
+    results = joblib.Parallel(n_jobs=N_JOBS, prefer='threads', return_as='generator_unordered')(
+        joblib.delayed(score_batch)(rows) for rows in batches
+    )
+    # Barra di avanzamento per la fase critica di predizione
+    for _ in tqdm(results, total=len(batches), desc="🔍 Scansione Traffico", unit="batch"):
+        pass
 
     # Classificazione
     score_threshold_malicious = -0.01
     score_threshold_suspicious = 0.0
 
-    def classify(score):
-        if score < score_threshold_malicious:
-            return 'malicious'
-        elif score < score_threshold_suspicious:
-            return 'suspicious'
-        else:
-            return 'good'
-
-    original_df['classification'] = original_df['anomaly_score'].apply(classify)
+    # Un ciclo compilato (o due confronti vettoriali) invece di una funzione Python per riga;
+    # la Categorical occupa 1 byte per riga invece di un oggetto stringa
+    codes = np.empty(num_rows, dtype=np.int8)
+    classify_codes(anomaly_scores, codes, score_threshold_malicious, score_threshold_suspicious)
+    classification = pd.Series(
+        pd.Categorical.from_codes(codes, categories=['malicious', 'suspicious', 'good']),
+        name='classification'
+    )
 
     print("\n--- Distribuzione Classificazioni ---")
-    print(original_df['classification'].value_counts())
+    print(classification.value_counts())
 
     print("\n--- Top 20 Richieste Più Anomale ---")
-    anomalous_requests = original_df[original_df['classification'] != 'good'].sort_values(
-        by='anomaly_score'
-    ).head(20)
+    # Prima troviamo le 20 posizioni sugli array, poi rileggiamo dal CSV solo quelle righe
+    candidates = np.flatnonzero(codes != 2)
+    top_idx = candidates[np.argsort(anomaly_scores[candidates], kind='stable')[:20]]
+    anomalous_requests = fetch_rows(file_path, top_idx).reindex(top_idx)
+    anomalous_requests['anomaly_score'] = anomaly_scores[top_idx]
+    # predict() rifarebbe lo stesso giro su tutti gli alberi: è solo il segno di decision_function
+    anomalous_requests['prediction'] = np.where(anomaly_scores[top_idx] < 0, -1, 1)
+    anomalous_requests['classification'] = classification.iloc[top_idx].to_numpy()
     print(anomalous_requests)
 
 if __name__ == "__main__":
@@ -147,10 +259,10 @@ if __name__ == "__main__":
         print("✅ Modello e vectorizer caricati con successo")
 
         # Carica e preprocessa i dati di test usando il vectorizer salvato
-        X_features, original_df, _ = load_and_preprocess_data(args.test, chunksize=CHUNK_SIZE, url_vectorizer=url_vectorizer)
+        X_features, _ = load_and_preprocess_data(args.test, chunksize=CHUNK_SIZE, url_vectorizer=url_vectorizer)
 
         # Analizza i risultati
-        analyze_results(trained_model, X_features, original_df)
+        analyze_results(trained_model, X_features, args.test)
 
         print(f"\n✅ Analisi completata per '{args.test}'.")
     else:
@@ -160,7 +272,7 @@ if __name__ == "__main__":
         data_source = DATA_FILE if os.path.exists(DATA_FILE) else SAMPLE_DATA_FILE
 
         # 1. Caricamento
-        X_features, original_df, url_vectorizer = load_and_preprocess_data(data_source, chunksize=CHUNK_SIZE)
+        X_features, url_vectorizer = load_and_preprocess_data(data_source, chunksize=CHUNK_SIZE)
 
         # 2. Training
         trained_model = train_model(X_features)
@@ -171,6 +283,6 @@ if __name__ == "__main__":
         joblib.dump(url_vectorizer, VECTORIZER_PATH)
 
         # 4. Analisi con barra di progresso
-        analyze_results(trained_model, X_features, original_df)
+        analyze_results(trained_model, X_features, data_source)
 
         print(f"\n✅ Tutto completato. Modello salvato in '{MODEL_OUTPUT_DIR}'.")